@@ -57,7 +57,50 @@ class QuadraticOracle(BaseSmoothOracle):
         return self.A.dot(x) - self.b
 
     def hess(self, x):
-        return self.A 
+        return self.A
+
+    def func_batch(self, X):
+        """
+        Computes the values of function at every column of n x K matrix X
+        at once: result_j = func(X[:, j]). One matrix-matrix product
+        instead of K matrix-vector ones.
+        """
+        AX = self.A.dot(X)
+        return 0.5 * np.einsum('ij,ij->j', X, AX) - self.b.dot(X)
+
+    def line_search_quadratic_coefs(self, x_k, d_k, f_k=None, g_k=None, dphi_0=None):
+        """
+        Returns the scalar coefficients (phi(0), phi'(0), d^T A d) of the
+        parabola phi(a) = func(x_k + a * d_k). After this single matvec
+        every phi value along the direction is O(1) arithmetic. Already
+        computed func / grad / directional-derivative values at x_k can be
+        passed in to be reused.
+        """
+        dAd = np.dot(d_k, self.A.dot(d_k))
+        if dphi_0 is None:
+            if g_k is None:
+                g_k = self.grad(x_k)
+            dphi_0 = np.dot(g_k, d_k)
+        if f_k is None:
+            f_k = self.func(x_k)
+        return float(f_k), float(dphi_0), float(dAd)
+
+    @property
+    def supports_grad_chunks(self):
+        """
+        Whether grad_accumulate may be used: it slices rows of A, which not
+        every matrix supports (dia sparse in particular is not subscriptable).
+        """
+        return isinstance(self.A, np.ndarray) or scipy.sparse.isspmatrix_csr(self.A)
+
+    def grad_accumulate(self, out, x, start, stop):
+        """
+        Fills the slice [start, stop) of the gradient into out[start:stop].
+        Disjoint slices are independent (grad(x) = Ax - b is computed row by
+        row), so they may be filled concurrently from several threads.
+        Only valid when supports_grad_chunks is True.
+        """
+        out[start:stop] = self.A[start:stop].dot(x) - self.b[start:stop]
 
 
 class LogRegL2Oracle(BaseSmoothOracle):